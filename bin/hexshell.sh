@@ -84,7 +84,7 @@ setup_venv() {
             pip install -r "$PROJECT_ROOT/requirements.txt"
         else
             # Fallback to manual installation
-            pip install 'textual>=0.40.0' watchdog pyyaml rich numpy matplotlib libtmux click
+            pip install 'textual>=0.40.0' watchdog pyyaml rich numpy click
         fi
         
         echo -e "${GREEN}Virtual environment setup complete!${NC}"
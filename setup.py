@@ -37,10 +37,14 @@ setup(
         "pyyaml>=6.0",
         "rich>=13.0.0",
         "numpy>=1.24.0",
-        "matplotlib>=3.7.0",
-        "libtmux>=0.25.0",
         "click>=8.1.0",
     ],
+    extras_require={
+        "plots": ["matplotlib>=3.7.0"],
+        "tmux": ["libtmux>=0.25.0"],
+        "numba": ["numba>=0.58"],
+        "uvloop": ["uvloop>=0.17; sys_platform != 'win32'"],
+    },
     entry_points={
         "console_scripts": [
             "hexshell=hexshell.main:main",
@@ -48,6 +52,6 @@ setup(
     },
     include_package_data=True,
     package_data={
-        "hexshell": ["*.css", "templates/*/*.md"],
+        "hexshell": ["*.tcss", "templates/*/*.md"],
     },
 )
\ No newline at end of file
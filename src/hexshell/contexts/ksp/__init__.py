@@ -1,3 +1,10 @@
-from .orbital_display import KSPOrbitalDisplay, OrbitalParameters, DeltaVCalculator
+from .orbital_display import OrbitalParameters, DeltaVCalculator
 
-__all__ = ['KSPOrbitalDisplay', 'OrbitalParameters', 'DeltaVCalculator']
\ No newline at end of file
+__all__ = ['KSPOrbitalDisplay', 'OrbitalParameters', 'DeltaVCalculator']
+
+
+def __getattr__(name: str):
+    if name == 'KSPOrbitalDisplay':
+        from .orbital_widget import KSPOrbitalDisplay
+        return KSPOrbitalDisplay
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
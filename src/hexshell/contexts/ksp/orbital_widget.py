@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+KSP Orbital Mechanics Display Panel
+Interactive ASCII representation of orbits and orbital parameters
+"""
+
+from typing import List
+
+import numpy as np
+from textual.widget import Widget
+from textual.reactive import reactive
+from textual import events
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.panel import Panel
+from rich.table import Table
+from rich.layout import Layout
+from rich.text import Text
+from rich.align import Align
+from rich.segment import Segment
+
+from .orbital_display import BODIES, OrbitalParameters
+
+
+class OrbitRows:
+    """Pre-rendered orbit rows, emitted straight as Segments.
+    
+    Handing Panel a plain string makes Rich parse markup and build a Text
+    on every refresh; the orbit art is fixed-size plain glyphs, so skip that.
+    """
+    
+    def __init__(self):
+        self.rows: List[str] = []
+    
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        newline = Segment.line()
+        for row in self.rows:
+            yield Segment(row)
+            yield newline
+
+
+class KSPOrbitalDisplay(Widget):    
+    current_body = reactive("kerbin")
+    apoapsis = reactive(100_000.0)  # 100km default
+    periapsis = reactive(80_000.0)   # 80km default
+    
+    PARAM_ROWS = (
+        ("Apoapsis:", "apoapsis"),
+        ("Periapsis:", "periapsis"),
+        ("Eccentricity:", "eccentricity"),
+        ("Orbital Period:", "period"),
+        ("Velocity @ Ap:", "v_apoapsis"),
+        ("Velocity @ Pe:", "v_periapsis"),
+    )
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Layout regions whose cells are stale; render() only rewrites these
+        self._dirty = {"header", "orbit_display", "parameters"}
+        self.orbital_params = None
+        self._update_orbital_params()
+        self._build_layout()
+    
+    def _build_layout(self):
+        # The layout never changes shape, so build it once and have
+        # render() rewrite only the dynamic cells
+        self._header_text = Text(style="bold cyan")
+        self._orbit_rows = OrbitRows()
+        self._orbit_panel = Panel(self._orbit_rows, border_style="cyan")
+        
+        params_table = Table(show_header=False, box=None, padding=(0, 1))
+        params_table.add_column("Parameter", style="cyan")
+        params_table.add_column("Value", style="green")
+        
+        self._param_cells = {}
+        for label, key in self.PARAM_ROWS:
+            self._param_cells[key] = Text()
+            params_table.add_row(label, self._param_cells[key])
+        
+        # Stays blank for airless bodies
+        self._atmo_label = Text()
+        self._atmo_value = Text()
+        params_table.add_row(self._atmo_label, self._atmo_value)
+        
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="orbit_display", size=15),
+            Layout(name="parameters", size=12),
+            Layout(name="controls", size=3)
+        )
+        self._layout["header"].update(Align.center(self._header_text))
+        self._layout["orbit_display"].update(self._orbit_panel)
+        self._layout["parameters"].update(Panel(params_table, title="Orbital Parameters", 
+                                                border_style="green"))
+        
+        controls = Text("[F3] Bodies  [F4] Maneuvers  [↑↓] Adjust Orbit", 
+                       style="dim", justify="center")
+        self._layout["controls"].update(controls)
+    
+    def _update_orbital_params(self):
+        self.orbital_params = OrbitalParameters(
+            self.current_body,
+            self.apoapsis,
+            self.periapsis
+        )
+    
+    def watch_current_body(self) -> None:
+        self._dirty.update(("header", "orbit_display", "parameters"))
+    
+    def watch_apoapsis(self) -> None:
+        self._dirty.update(("orbit_display", "parameters"))
+    
+    def watch_periapsis(self) -> None:
+        self._dirty.update(("orbit_display", "parameters"))
+    
+    def set_body(self, body_name: str):
+        if body_name.lower() in BODIES:
+            self.current_body = body_name.lower()
+            self._update_orbital_params()
+            self.refresh()
+    
+    def set_orbit(self, apoapsis: float, periapsis: float):
+        self.apoapsis = apoapsis
+        self.periapsis = periapsis
+        self._update_orbital_params()
+        self.refresh()
+    
+    def render(self) -> RenderResult:
+        dirty = self._dirty
+        body = BODIES[self.current_body]
+        
+        if "header" in dirty:
+            self._header_text.plain = f"{body.symbol} {body.name.upper()} ORBITAL MECHANICS"
+        
+        if "orbit_display" in dirty:
+            self._orbit_rows.rows = self._generate_orbit_rows()
+        
+        if "parameters" in dirty:
+            self._update_param_cells(body)
+        
+        dirty.clear()
+        return self._layout
+    
+    def _update_param_cells(self, body):
+        params = self.orbital_params.get_display_values()
+        
+        for key, cell in self._param_cells.items():
+            cell.plain = params[key]
+        
+        if body.atmosphere > 0:
+            atmo_height = body.atmosphere / 1000
+            if self.periapsis < body.atmosphere:
+                self._atmo_label.plain = ""
+                self._atmo_value.plain = "⚠ PERIAPSIS IN ATMOSPHERE!"
+                self._atmo_value.style = "red"
+            else:
+                self._atmo_label.plain = "Atmosphere:"
+                self._atmo_value.plain = f"{atmo_height:.0f} km"
+                self._atmo_value.style = ""
+        else:
+            self._atmo_label.plain = ""
+            self._atmo_value.plain = ""
+    
+    def _generate_orbit_rows(self) -> List[str]:
+        width = 40
+        height = 12
+        center_x = width // 2
+        center_y = height // 2
+        
+        a = int(width * 0.4)  # semi-major axis in characters
+        b = int(height * 0.4 * (1 - self.orbital_params.eccentricity))  # semi-minor axis
+        
+        yy, xx = np.ogrid[0:height, 0:width]
+        dx = xx - center_x
+        dy = yy - center_y
+        
+        grid = np.full((height, width), ' ', dtype='<U1')
+        
+        if b > 0:  # Prevent division by zero
+            ellipse_value = (dx/a)**2 + (dy/b)**2
+            grid[(0.8 < ellipse_value) & (ellipse_value < 1.2)] = '·'
+        
+        body_radius = 3
+        grid[dx**2 + (dy*2)**2 <= body_radius**2] = '█'
+        grid[center_y, center_x] = '★'
+        
+        grid[center_y, center_x + a - 1] = 'A'  # Apoapsis
+        grid[center_y, center_x - a + 1] = 'P'  # Periapsis
+        
+        # View each row of single chars as one fixed-width string instead of
+        # materializing a str object per cell
+        return grid.view(f'<U{width}').ravel().tolist()
+    
+    def _apoapsis_up(self):
+        self.apoapsis = min(self.apoapsis + 10_000, 1_000_000)
+    
+    def _apoapsis_down(self):
+        self.apoapsis = max(self.apoapsis - 10_000, self.periapsis + 1000)
+    
+    def _periapsis_up(self):
+        self.periapsis = min(self.periapsis + 10_000, self.apoapsis - 1000)
+    
+    def _periapsis_down(self):
+        body = BODIES[self.current_body]
+        min_periapsis = body.atmosphere + 5000 if body.atmosphere > 0 else 10_000
+        self.periapsis = max(self.periapsis - 10_000, min_periapsis)
+    
+    KEY_HANDLERS = {
+        "up": _apoapsis_up,
+        "down": _apoapsis_down,
+        "shift+up": _periapsis_up,
+        "shift+down": _periapsis_down,
+    }
+    
+    def on_key(self, event: events.Key) -> None:
+        handler = self.KEY_HANDLERS.get(event.key)
+        if handler is not None:
+            handler(self)
+            self._update_orbital_params()
+            self.refresh()
@@ -5,9 +5,22 @@ Handles loading and saving configuration files
 """
 
 import os
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
+@lru_cache(maxsize=128)
+def _split_key(key: str) -> Tuple[str, ...]:
+    return tuple(key.split('.'))
 
 
 class ConfigManager:
@@ -74,20 +87,39 @@ class ConfigManager:
         if config_path:
             self.config_path = Path(config_path)
         else:
-            xdg_config = os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config'))
+            xdg_config = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
             self.config_dir = Path(xdg_config) / 'hexshell'
             self.config_path = self.config_dir / 'config.yaml'
         
         self.config_dir = self.config_path.parent
         self.config: Dict[str, Any] = {}
         
+        # Extra profiles can live one-per-file in profiles.d/ so config.yaml
+        # stays small; they are only parsed when first asked for
+        self.profiles_dir = self.config_dir / 'profiles.d'
+        self._shard_profiles: Set[str] = set()
+        
+        # Parsed and merged config, keyed on the file's (mtime_ns, size)
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._cached_config: Dict[str, Any] = {}
+        
     def load_config(self) -> Dict[str, Any]:
+        self._shard_profiles.clear()
+        
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    self.config = yaml.safe_load(f) or {}
+                stat = self.config_path.stat()
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+                
+                if cache_key != self._cache_key:
+                    with open(self.config_path, 'r') as f:
+                        loaded = yaml.load(f, Loader=YamlLoader) or {}
+                    
+                    self._cached_config = self._merge_with_defaults(loaded)
+                    self._cache_key = cache_key
                 
-                self.config = self._merge_with_defaults(self.config)
+                # Callers mutate the returned config, so never hand out the cache itself
+                self.config = copy.deepcopy(self._cached_config)
                 
             except Exception as e:
                 print(f"Error loading config: {e}")
@@ -97,7 +129,10 @@ class ConfigManager:
             self.config = self.DEFAULT_CONFIG.copy()
             self.save_config()
         
-        self.config['storage_path'] = os.path.expanduser(self.config['storage_path'])
+        # Only paths still in ~ form need expanding; an already-absolute
+        # storage_path is left alone
+        if self.config['storage_path'].startswith('~'):
+            self.config['storage_path'] = os.path.expanduser(self.config['storage_path'])
         
         return self.config
     
@@ -105,8 +140,15 @@ class ConfigManager:
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
             
+            config = self.config
+            if self._shard_profiles:
+                # Shard profiles stay in their own profiles.d files
+                config = dict(config)
+                config['profiles'] = {name: profile for name, profile in config['profiles'].items()
+                                      if name not in self._shard_profiles}
+            
             with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
             
             return True
             
@@ -129,7 +171,10 @@ class ConfigManager:
         return merge_dicts(self.DEFAULT_CONFIG, config)
     
     def get(self, key: str, default: Any = None) -> Any:
-        keys = key.split('.')
+        if '.' not in key:
+            return self.config.get(key, default)
+        
+        keys = _split_key(key)
         value = self.config
         
         for k in keys:
@@ -141,7 +186,7 @@ class ConfigManager:
         return value
     
     def set(self, key: str, value: Any) -> None:
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config
         
         for k in keys[:-1]:
@@ -152,7 +197,45 @@ class ConfigManager:
         config[keys[-1]] = value
     
     def get_profile(self, profile_name: str) -> Optional[Dict[str, Any]]:
-        return self.config.get('profiles', {}).get(profile_name)
+        profiles = self.config.setdefault('profiles', {})
+        profile = profiles.get(profile_name)
+        
+        if profile is None:
+            profile = self._load_profile_shard(profile_name)
+            if profile is not None:
+                profiles[profile_name] = profile
+                self._shard_profiles.add(profile_name)
+        
+        return profile
+    
+    def get_profile_names(self) -> List[str]:
+        names = list(self.config.get('profiles', {}))
+        
+        # Listing profiles.d only needs the file names, not their contents
+        try:
+            with os.scandir(self.profiles_dir) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext in ('.yaml', '.yml') and name not in names and entry.is_file():
+                        names.append(name)
+        except OSError:
+            pass
+        
+        return names
+    
+    def _load_profile_shard(self, profile_name: str) -> Optional[Dict[str, Any]]:
+        for ext in ('.yaml', '.yml'):
+            shard_path = self.profiles_dir / f"{profile_name}{ext}"
+            if shard_path.is_file():
+                try:
+                    with open(shard_path, 'r') as f:
+                        profile = yaml.load(f, Loader=YamlLoader)
+                except Exception as e:
+                    print(f"Error loading profile {profile_name}: {e}")
+                    return None
+                return profile if isinstance(profile, dict) else None
+        
+        return None
     
     def get_storage_path(self, profile: Optional[str] = None) -> Path:
         base_path = Path(self.config['storage_path'])
@@ -4,26 +4,59 @@ Profile Manager for HexShell
 Handles profile switching and profile-specific configurations
 """
 
-from typing import Dict, List, Optional, Any
+import os
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Any
 from pathlib import Path
 from datetime import datetime
 
 
+def _iter_files(root: Path) -> Iterator[os.DirEntry]:
+    # Iterative scandir walk; DirEntry caches its type and stat results, so
+    # each file costs far fewer syscalls than rglob + is_file + stat
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # Unreadable or already gone; rglob skipped these too
+        
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
 class ProfileManager:    
+    PROFILE_STRUCTURES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        'gaming': ('ksp/missions', 'ksp/designs', 'ksp/science', 
+                   'factorio/blueprints', 'factorio/ratios', 
+                   'general/guides', 'general/notes'),
+        'cybersec': ('reports', 'research/exploits', 'research/vulnerabilities',
+                     'tools/scripts', 'tools/configs', 'networks/scans',
+                     'networks/diagrams'),
+        'embedded': ('arduino/projects', 'arduino/libraries', 
+                     'circuits/schematics', 'circuits/pcb',
+                     'datasheets', 'sensors/logs'),
+        'general': ('projects', 'notes', 'research', 'archives'),
+    })
+    
     def __init__(self, config_manager):
         self.config_manager = config_manager
         self.current_profile = None
         self.profile_history = []
         
     def get_available_profiles(self) -> List[str]:
-        profiles = self.config_manager.get('profiles', {})
-        return list(profiles.keys())
+        return self.config_manager.get_profile_names()
     
     def get_profile_info(self, profile_name: str) -> Optional[Dict[str, Any]]:
         return self.config_manager.get_profile(profile_name)
     
     def set_current_profile(self, profile_name: str) -> bool:
-        if profile_name in self.get_available_profiles():
+        if self.config_manager.get_profile(profile_name) is not None:
             self.current_profile = profile_name
             self.profile_history.append({
                 'profile': profile_name,
@@ -39,21 +72,9 @@ class ProfileManager:
         return False
     
     def _create_profile_structure(self, profile_name: str, base_path: Path):
-        structures = {
-            'gaming': ['ksp/missions', 'ksp/designs', 'ksp/science', 
-                      'factorio/blueprints', 'factorio/ratios', 
-                      'general/guides', 'general/notes'],
-            'cybersec': ['reports', 'research/exploits', 'research/vulnerabilities',
-                        'tools/scripts', 'tools/configs', 'networks/scans',
-                        'networks/diagrams'],
-            'embedded': ['arduino/projects', 'arduino/libraries', 
-                        'circuits/schematics', 'circuits/pcb',
-                        'datasheets', 'sensors/logs'],
-            'general': ['projects', 'notes', 'research', 'archives']
-        }
-        
-        subdirs = structures.get(profile_name, ['notes'])
+        subdirs = self.PROFILE_STRUCTURES.get(profile_name, ('notes',))
         
+        # Only leaf directories are listed; parents=True creates the rest
         for subdir in subdirs:
             dir_path = base_path / subdir
             dir_path.mkdir(parents=True, exist_ok=True)
@@ -103,22 +124,17 @@ class ProfileManager:
     def get_profile_statistics(self, profile_name: str) -> Dict[str, Any]:
         storage_path = self.config_manager.get_storage_path(profile_name)
         
-        total_files = 0
         total_size = 0
-        file_types = {}
+        extensions = []
         
         if storage_path.exists():
-            for file_path in storage_path.rglob('*'):
-                if file_path.is_file():
-                    total_files += 1
-                    total_size += file_path.stat().st_size
-                    
-                    ext = file_path.suffix.lower()
-                    file_types[ext] = file_types.get(ext, 0) + 1
+            for entry in _iter_files(storage_path):
+                total_size += entry.stat().st_size
+                extensions.append(os.path.splitext(entry.name)[1].lower())
         
         return {
-            'total_files': total_files,
+            'total_files': len(extensions),
             'total_size': total_size,
-            'file_types': file_types,
+            'file_types': dict(Counter(extensions)),
             'last_accessed': datetime.now()  # Would track this properly
         }
\ No newline at end of file
@@ -7,13 +7,13 @@ Cyberpunk terminal interface for technical note-taking
 import asyncio
 import sys
 import os
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Static, Tree, TextArea, Button, Input
-from textual.reactive import reactive
 from textual.binding import Binding
 from textual import events
 from rich.console import Console
@@ -32,97 +32,88 @@ from hexshell.ui.themes import ThemeManager
 from hexshell.ui.widgets import CommandInput, ProfileSelector
 
 
+# Cycle orders for Ctrl+P and F2, with name -> position lookups
+_PROFILES = ("gaming", "cybersec", "embedded", "general")
+_PROFILE_IDX = {name: idx for idx, name in enumerate(_PROFILES)}
+
+_THEMES = ("cyberpunk_green", "cyberpunk_amber", "cyberpunk_cyan", "cyberpunk_red")
+_THEME_IDX = {name: idx for idx, name in enumerate(_THEMES)}
+
+# Right-panel header for each profile; anything else gets the general tools
+_PROFILE_HEADERS = {
+    "gaming": "🚀 ORBITAL MECHANICS",
+    "cybersec": "🔒 SECURITY TOOLS",
+    "embedded": "🔧 HARDWARE TOOLS",
+}
+
+_WELCOME_TEXT = """# Welcome to HexShell
+
+## Your Cyberpunk Terminal Interface
+
+### Quick Start:
+- **Ctrl+N**: Create new note
+- **Ctrl+P**: Switch profile  
+- **Ctrl+/**: Focus command bar
+- **F1**: Show help
+- **F2**: Change theme
+
+### Available Commands:
+- `:new [template]` - Create new note
+- `:profile <name>` - Switch profile
+- `:deltav <from> <to>` - Calculate delta-v
+- `:orbit <body>` - Change orbital display
+- `:theme <name>` - Change theme
+- `:help` - Show all commands
+
+### Current Profile: Gaming (KSP)
+The right panel shows orbital mechanics for KSP.
+Select a file from the left panel to begin editing.
+
+---
+*Embrace the imperfect terminal aesthetic*
+"""
+
+_HELP_TEXT = """# HexShell Commands
+
+## Global Commands
+- `:quit` or `:q` - Exit HexShell
+- `:new [template]` - Create new note
+- `:profile <name>` - Switch profile
+- `:help` - Show this help
+
+## Keyboard Shortcuts
+- `Ctrl+N` - New note
+- `Ctrl+S` - Save current file
+- `Ctrl+P` - Switch profile
+- `Ctrl+/` - Focus command bar
+- `Ctrl+Q` - Quit
+- `F1` - Toggle help
+- `F2` - Cycle themes
+"""
+
+
+def _read_note(file_path: Path) -> str:
+    """Read a note as UTF-8 without text-mode newline translation"""
+    # O_BINARY keeps Windows' C runtime from translating line endings.
+    # Skip the atime update when the OS allows it; O_NOATIME is refused
+    # for files we don't own, so fall back to a plain read-only open
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(file_path, flags | getattr(os, "O_NOATIME", 0))
+    except PermissionError:
+        fd = os.open(file_path, flags)
+    
+    with open(fd, "rb") as f:
+        data = f.read()
+    
+    return data.decode("utf-8", "replace")
+
+
 class HexShell(App):
     """Main HexShell Application"""
     
-    # Load CSS as a string instead of using CSS_PATH
-    # This ensures it works regardless of working directory
-    DEFAULT_CSS = """
-    Screen {
-        background: #0a0a0a;
-    }
-    
-    Header {
-        background: #1a1a1a;
-        color: #00ff00;
-        height: 3;
-    }
-    
-    #main-container {
-        height: 100%;
-    }
-    
-    #panels {
-        height: 1fr;
-    }
-    
-    #left-panel {
-        width: 1fr;
-    }
-    
-    #middle-panel {
-        width: 2fr;
-    }
-    
-    #right-panel {
-        width: 1fr;
-    }
-    
-    .panel {
-        border: solid #00ff00;
-        padding: 1;
-    }
-    
-    .panel-header {
-        background: #1a1a1a;
-        color: #00ff00;
-        padding: 1;
-        height: 3;
-    }
-    
-    Tree {
-        background: #0f0f0f;
-        color: #00ff00;
-    }
-    
-    TextArea {
-        background: #0a0a0a;
-        color: #00ff00;
-    }
-    
-    Input {
-        background: #0a0a0a;
-        color: #00ff00;
-        border: solid #00ff00;
-    }
-    
-    #command-bar {
-        height: 3;
-        background: #1a1a1a;
-    }
-    
-    #command-input {
-        width: 100%;
-    }
-    
-    Footer {
-        background: #1a1a1a;
-        color: #00ff00;
-    }
-    
-    Button {
-        background: #1a1a1a;
-        color: #00ff00;
-        border: solid #00ff00;
-    }
-    
-    Static {
-        color: #00ff00;
-    }
-    """
-    
-    # Use the CSS string directly
-    CSS = DEFAULT_CSS
+    # Resolved next to this module so it works regardless of working directory
+    CSS_PATH = Path(__file__).with_name("hexshell.tcss")
     
     TITLE = "HexShell v1.0"
     
@@ -136,9 +127,6 @@ class HexShell(App):
         Binding("ctrl+slash", "focus_command", "Command"),
     ]
     
-    current_profile = reactive("gaming")
-    current_file = reactive(None)
-    
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
@@ -147,9 +135,20 @@ class HexShell(App):
         
         self.config = self.config_manager.load_config()
         
+        # Nothing watches these, so plain attributes rather than reactives
+        self.current_profile = "gaming"
+        self.current_file: Optional[Path] = None
+        
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Toasts queued during one loop tick are shown together on the next
+        self._notify_queue = deque()
+        self._notify_scheduled = False
+        
         self.file_tree = None
         self.editor = None
         self.context_panel = None
+        self.context_header = None
         self.command_input = None
         
     def compose(self) -> ComposeResult:
@@ -185,9 +184,17 @@ class HexShell(App):
     
     async def on_mount(self) -> None:
         """Initialize the app after mounting"""
+        self._event_loop = asyncio.get_running_loop()
+        
+        # Most handlers finish without awaiting anything; eager tasks run
+        # those inline instead of queueing them on the loop (Python 3.12+)
+        if sys.version_info >= (3, 12):
+            self._event_loop.set_task_factory(asyncio.eager_task_factory)
+        
         self.file_tree = self.query_one("#file-tree", FileTreePanel)
         self.editor = self.query_one("#editor", MarkdownEditor)
         self.context_panel = self.query_one("#context-display", KSPOrbitalDisplay)
+        self.context_header = self.query_one("#context-header", Static)
         self.command_input = self.query_one("#command-input", CommandInput)
         
         # Set initial profile
@@ -198,63 +205,42 @@ class HexShell(App):
     
     def show_welcome_message(self):
         """Display welcome message in editor"""
-        welcome_text = """# Welcome to HexShell
-
-## Your Cyberpunk Terminal Interface
-
-### Quick Start:
-- **Ctrl+N**: Create new note
-- **Ctrl+P**: Switch profile  
-- **Ctrl+/**: Focus command bar
-- **F1**: Show help
-- **F2**: Change theme
-
-### Available Commands:
-- `:new [template]` - Create new note
-- `:profile <name>` - Switch profile
-- `:deltav <from> <to>` - Calculate delta-v
-- `:orbit <body>` - Change orbital display
-- `:theme <name>` - Change theme
-- `:help` - Show all commands
-
-### Current Profile: Gaming (KSP)
-The right panel shows orbital mechanics for KSP.
-Select a file from the left panel to begin editing.
-
----
-*Embrace the imperfect terminal aesthetic*
-"""
-        self.editor.set_content(welcome_text)
+        self.editor.set_content(_WELCOME_TEXT)
     
     async def set_profile(self, profile_name: str) -> None:
         """Switch to a different profile"""
         self.current_profile = profile_name
-        profile = self.config['profiles'].get(profile_name)
+        profile = self.config_manager.get_profile(profile_name)
         
         if profile:
             self.file_tree.set_profile(profile_name)
             
             # Update context panel header based on profile
-            context_header = self.query_one("#context-header", Static)
-            
-            if profile_name == "gaming":
-                context_header.update("🚀 ORBITAL MECHANICS")
-            elif profile_name == "cybersec":
-                context_header.update("🔒 SECURITY TOOLS")
-            elif profile_name == "embedded":
-                context_header.update("🔧 HARDWARE TOOLS")
-            else:
-                context_header.update("📊 GENERAL TOOLS")
+            self.context_header.update(_PROFILE_HEADERS.get(profile_name, "📊 GENERAL TOOLS"))
             
             # Show notification
-            self.notify(f"Switched to {profile['name']} profile")
+            self._queue_notify(f"Switched to {profile['name']} profile")
+    
+    def _queue_notify(self, message: str, severity: str = "information") -> None:
+        self._notify_queue.append((message, severity))
+        
+        if not self._notify_scheduled:
+            self._notify_scheduled = True
+            self._event_loop.call_soon(self._drain_notify)
+    
+    def _drain_notify(self) -> None:
+        self._notify_scheduled = False
+        queue = self._notify_queue
+        
+        while queue:
+            message, severity = queue.popleft()
+            self.notify(message, severity=severity)
     
     async def action_switch_profile(self) -> None:
         """Cycle through profiles"""
-        profiles = ["gaming", "cybersec", "embedded", "general"]
-        current_idx = profiles.index(self.current_profile)
-        next_idx = (current_idx + 1) % len(profiles)
-        await self.set_profile(profiles[next_idx])
+        # A profile outside the cycle (e.g. a custom one) moves to the first
+        next_idx = (_PROFILE_IDX.get(self.current_profile, -1) + 1) % len(_PROFILES)
+        await self.set_profile(_PROFILES[next_idx])
     
     async def action_new_note(self) -> None:
         """Create a new note"""
@@ -265,7 +251,7 @@ Select a file from the left panel to begin editing.
         """Save current file"""
         if self.current_file and self.editor.text:
             # TODO: Implement file saving
-            self.notify("File saved!")
+            self._queue_notify("File saved!")
     
     async def action_focus_command(self) -> None:
         """Focus the command input"""
@@ -273,94 +259,112 @@ Select a file from the left panel to begin editing.
     
     async def action_toggle_theme(self) -> None:
         """Cycle through themes"""
-        themes = ["cyberpunk_green", "cyberpunk_amber", "cyberpunk_cyan", "cyberpunk_red"]
         current = self.config.get('theme', 'cyberpunk_green')
         
-        try:
-            current_idx = themes.index(current)
-            next_theme = themes[(current_idx + 1) % len(themes)]
-        except ValueError:
-            next_theme = themes[0]
+        # An unknown theme name falls back to the first theme
+        next_theme = _THEMES[(_THEME_IDX.get(current, -1) + 1) % len(_THEMES)]
         
         # For now just notify - theme switching would update CSS
-        self.notify(f"Theme: {next_theme} (CSS theming in development)")
+        self._queue_notify(f"Theme: {next_theme} (CSS theming in development)")
     
-    async def on_command_input_submitted(self, event) -> None:
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle command submission"""
-        command = event.value.strip()
+        # Other inputs (e.g. the calculator) submit through here too
+        if event.input is not self.command_input:
+            return
+        
+        if not event.value:
+            return  # Nothing to run and the prompt is already empty
         
-        if command.startswith(':'):
+        command = event.value.strip()
+        if len(command) > 1 and command[0] == ':':
             await self.execute_command(command[1:])
         
         self.command_input.value = ""
     
     async def execute_command(self, command: str) -> None:
         """Execute a command"""
-        parts = command.split()
-        if not parts:
+        cmd, _, tail = command.strip().partition(" ")
+        if not cmd:
             return
         
-        cmd = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
+        cmd = cmd.lower()
+        args = tail.split() if tail else []
+        
+        handler = self._COMMANDS.get(cmd)
+        if handler is None:
+            self._queue_notify(f"Unknown command: {cmd}", "warning")
+            return
         
-        if cmd == "quit" or cmd == "q":
-            self.exit()
-        elif cmd == "new":
-            template = args[0] if args else None
-            await self.create_new_note(template)
-        elif cmd == "profile":
-            if args:
-                await self.set_profile(args[0])
-        elif cmd == "orbit":
-            if args and self.current_profile == "gaming":
-                self.context_panel.set_body(args[0])
-        elif cmd == "help":
-            self.show_help()
-        else:
-            self.notify(f"Unknown command: {cmd}", severity="warning")
+        await handler(self, args)
+    
+    async def _cmd_quit(self, args: List[str]) -> None:
+        self.exit()
+    
+    async def _cmd_new(self, args: List[str]) -> None:
+        template = args[0] if args else None
+        await self.create_new_note(template)
+    
+    async def _cmd_profile(self, args: List[str]) -> None:
+        if args:
+            await self.set_profile(args[0])
+    
+    async def _cmd_orbit(self, args: List[str]) -> None:
+        if args and self.current_profile == "gaming":
+            self.context_panel.set_body(args[0])
+    
+    async def _cmd_help(self, args: List[str]) -> None:
+        self.show_help()
+    
+    _COMMANDS = {
+        "quit": _cmd_quit,
+        "q": _cmd_quit,
+        "new": _cmd_new,
+        "profile": _cmd_profile,
+        "orbit": _cmd_orbit,
+        "help": _cmd_help,
+    }
     
     async def create_new_note(self, template: Optional[str] = None) -> None:
         """Create a new note with optional template"""
         # TODO: Implement note creation
-        self.notify("Creating new note...")
+        self._queue_notify("Creating new note...")
     
     def show_help(self) -> None:
         """Show help in editor"""
-        help_text = """# HexShell Commands
-
-## Global Commands
-- `:quit` or `:q` - Exit HexShell
-- `:new [template]` - Create new note
-- `:profile <name>` - Switch profile
-- `:help` - Show this help
-
-## Keyboard Shortcuts
-- `Ctrl+N` - New note
-- `Ctrl+S` - Save current file
-- `Ctrl+P` - Switch profile
-- `Ctrl+/` - Focus command bar
-- `Ctrl+Q` - Quit
-- `F1` - Toggle help
-- `F2` - Cycle themes
-"""
-        self.editor.set_content(help_text)
+        self.editor.set_content(_HELP_TEXT)
     
-    def on_file_tree_file_selected(self, event) -> None:
+    async def on_file_tree_panel_file_selected(self, event: FileTreePanel.FileSelected) -> None:
         """Handle file selection from tree"""
         file_path = event.file_path
         self.current_file = file_path
         
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-            self.editor.set_content(content)
-            self.notify(f"Opened: {file_path.name}")
+            # Read in a worker thread so a large file doesn't stall the UI
+            content = await asyncio.to_thread(_read_note, file_path)
+            self.editor.set_content(content, file_path)
+            self._queue_notify(f"Opened: {file_path.name}")
         except Exception as e:
-            self.notify(f"Error opening file: {e}", severity="error")
+            self._queue_notify(f"Error opening file: {e}", "error")
+
+
+def _install_uvloop() -> None:
+    """Run asyncio on uvloop's libuv-backed loop when it is installed"""
+    if sys.platform == "win32":
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main():
     """Main entry point"""
+    _install_uvloop()
+    
     app = HexShell()
     app.run()
 
@@ -4,10 +4,12 @@ Markdown Editor Panel for HexShell
 Provides syntax highlighting and vim-like keybindings
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
-from textual.widgets import TextArea
+from textual.widgets import Static, TextArea
 from textual.reactive import reactive
 from textual.binding import Binding
 from textual import events
@@ -15,6 +17,23 @@ from rich.syntax import Syntax
 from rich.console import Console
 
 
+# Note templates ship as markdown files under hexshell/templates/ and are
+# only read from disk the first time each one is inserted
+_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+_TEMPLATE_FILES = {
+    "ksp_mission": "gaming/ksp_mission.md",
+    "vessel_design": "gaming/vessel_design.md",
+    "factorio_blueprint": "gaming/factorio_blueprint.md",
+    "pentest_report": "cybersec/pentest_report.md",
+}
+
+
+@lru_cache(maxsize=None)
+def _read_template(template_file: str) -> str:
+    return (_TEMPLATE_DIR / template_file).read_text(encoding="utf-8")
+
+
 class MarkdownEditor(TextArea):
     """Enhanced markdown editor with syntax highlighting"""
     
@@ -40,46 +59,94 @@ class MarkdownEditor(TextArea):
         'horizontal_rule': r'^---+$|^\*\*\*+$',
     }
     
+    # Documents longer than this (in characters) are loaded in slices
+    LOAD_CHUNK_SIZE = 65536
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.file_path: Optional[Path] = None
         self.modified = False
         self.vim_mode = "insert"  # Start in insert mode for ease of use
         
+        self._header: Optional[Static] = None
+        self._header_timer = None
+        self._load_generation = 0
+        # Changed messages still to come from our own loads, not the user
+        self._load_changes = 0
+        
         self.show_line_numbers = True
         self.language = "markdown"
         self.theme = "monokai"
         
     def set_content(self, content: str, file_path: Optional[Path] = None):
-        self.clear()
-        self.insert(content)
+        # Anything past the first slice is appended over later refreshes, so
+        # the first screenful of a large note paints straight away
+        self._load_generation += 1
+        first_end = self._chunk_end(content, 0)
+        
+        self.load_text(content[:first_end])
+        self._load_changes += 1
         self.file_path = file_path
         self.modified = False
         
         self.cursor_location = (0, 0)
         
-    def get_content(self) -> str:
-        return self.text
+        if first_end < len(content):
+            self.call_after_refresh(self._append_chunk, content, first_end, self._load_generation)
+    
+    def _chunk_end(self, content: str, start: int) -> int:
+        end = start + self.LOAD_CHUNK_SIZE
+        if end >= len(content):
+            return len(content)
+        
+        # Break after a newline where possible so no line is split across slices
+        newline = content.rfind('\n', start, end)
+        return newline + 1 if newline >= start else end
+    
+    def _append_chunk(self, content: str, start: int, generation: int):
+        if generation != self._load_generation:
+            return  # A newer set_content replaced this document
+        
+        end = self._chunk_end(content, start)
+        self.insert(content[start:end], self.document.end)
+        self._load_changes += 1
+        
+        if end < len(content):
+            self.call_after_refresh(self._append_chunk, content, end, generation)
+        else:
+            # The slices went in as edits; undo shouldn't peel the file back apart
+            self.history.clear()
+        
+    def on_mount(self):
+        # The header sits beside the editor for its whole life, so look it up once
+        self._header = self.parent.query_one("#editor-header", Static)
     
-    def on_text_changed(self, event):
+    def on_text_area_changed(self, event: TextArea.Changed):
+        if self._load_changes:
+            self._load_changes -= 1
+            return
+        
         self.modified = True
         
+        # Coalesce a burst of keystrokes into one header update
+        if self.file_path and self._header_timer is None:
+            self._header_timer = self.set_timer(0.1, self._flush_header)
+    
+    def _flush_header(self):
+        self._header_timer = None
+        
         if self.file_path:
-            header = self.parent.query_one("#editor-header")
-            if header:
-                file_name = self.file_path.name
-                header.update(f"📝 EDITOR - {file_name} {'*' if self.modified else ''}")
+            file_name = self.file_path.name
+            self._header.update(f"📝 EDITOR - {file_name} {'*' if self.modified else ''}")
     
-    def action_save(self):
+    async def action_save(self):
         if self.file_path and self.modified:
             try:
-                self.file_path.write_text(self.text)
+                await asyncio.to_thread(self.file_path.write_text, self.text)
                 self.modified = False
                 self.notify("File saved!", severity="information")
                 
-                header = self.parent.query_one("#editor-header")
-                if header:
-                    header.update(f"📝 EDITOR - {self.file_path.name}")
+                self._header.update(f"📝 EDITOR - {self.file_path.name}")
                     
             except Exception as e:
                 self.notify(f"Error saving file: {e}", severity="error")
@@ -97,161 +164,8 @@ class MarkdownEditor(TextArea):
         self.notify("-- INSERT --", severity="information")
     
     def insert_template(self, template_name: str):
-        templates = {
-            "ksp_mission": """# KSP Mission: [Mission Name]
-
-## Mission Objectives
-- Primary: 
-- Secondary: 
-- Optional: 
-
-## Vehicle Design
-- Launch Vehicle: 
-- Payload: 
-- Total Delta-V: 
-- Total Mass: 
-
-## Mission Profile
-1. Launch Window: 
-2. Ascent Profile: 
-3. Orbital Insertion: 
-4. Transfer Burn: 
-5. Arrival: 
-6. Landing/Docking: 
-7. Return: 
-
-## Delta-V Budget
-| Maneuver | Delta-V (m/s) | Notes |
-|----------|---------------|-------|
-| Launch   |               |       |
-| Transfer |               |       |
-| Capture  |               |       |
-| Landing  |               |       |
-| Return   |               |       |
-| **Total**|               |       |
-
-## Notes
-""",
-            "vessel_design": """# Vessel Design: [Vessel Name]
-
-## Purpose
-[Mission type and requirements]
-
-## Specifications
-- Total Mass: [X] tons
-- Crew Capacity: [X]
-- Delta-V (vacuum): [X] m/s
-- TWR (launch): [X]
-
-## Stage Breakdown
-### Stage 1 (Booster)
-- Engines: 
-- Fuel: 
-- Delta-V: 
-- TWR: 
-
-### Stage 2 (Core)
-- Engines: 
-- Fuel: 
-- Delta-V: 
-- TWR: 
-
-### Stage 3 (Payload)
-- Components: 
-- Science Equipment: 
-- Special Features: 
-
-## Action Groups
-1. [Action Group 1]
-2. [Action Group 2]
-3. [Action Group 3]
-
-## Design Notes
-""",
-            "factorio_blueprint": """# Factorio Blueprint: [Name]
-
-## Purpose
-[What this blueprint accomplishes]
-
-## Requirements
-- Space: [X]x[Y] tiles
-- Power: [X] MW
-- Resources:
-  - Iron Plates: [X]/min
-  - Copper Plates: [X]/min
-  - Other: 
-
-## Production Rates
-| Item | Rate/min | Machines |
-|------|----------|----------|
-|      |          |          |
-
-## Blueprint String
-```
-[Paste blueprint string here]
-```
-
-## Setup Instructions
-1. 
-2. 
-3. 
-
-## Notes
-""",
-            "pentest_report": """# Penetration Test Report: [Target]
-
-## Executive Summary
-Date: [Date]
-Tester: [Name]
-Scope: [IP ranges/domains]
-
-## Findings Summary
-| Severity | Count |
-|----------|-------|
-| Critical | 0     |
-| High     | 0     |
-| Medium   | 0     |
-| Low      | 0     |
-| Info     | 0     |
-
-## Detailed Findings
-
-### Finding 1: [Title]
-**Severity**: [Critical/High/Medium/Low]
-**CVSS**: [Score]
-
-**Description**:
-[Detailed description]
-
-**Impact**:
-[Business impact]
-
-**Proof of Concept**:
-```bash
-[Commands or code]
-```
-
-**Remediation**:
-[Steps to fix]
-
-## Methodology
-- [ ] Reconnaissance
-- [ ] Scanning
-- [ ] Enumeration
-- [ ] Exploitation
-- [ ] Post-Exploitation
-- [ ] Reporting
-
-## Tools Used
-- 
-- 
-- 
-
-## Appendix
-""",
-        }
-        
-        template_content = templates.get(template_name, "# New Document\n\n")
+        template_file = _TEMPLATE_FILES.get(template_name)
+        template_content = _read_template(template_file) if template_file else "# New Document\n\n"
         self.insert(template_content)
     
     def toggle_markdown_preview(self):
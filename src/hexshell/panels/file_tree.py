@@ -5,31 +5,210 @@ Displays project files with auto-updating capability
 """
 
 import os
+import atexit
+import threading
 from pathlib import Path
-from typing import Optional, Dict, List
-from datetime import datetime
+from collections import OrderedDict
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Optional, Dict, List, Set, Tuple
 
-from textual.widget import Widget
 from textual.widgets import Tree
 from textual.widgets._tree import TreeNode
-from textual.reactive import reactive
 from textual.message import Message
-from textual import events
 from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
 
+# Shared by every panel and never modified
+FILE_ICONS = MappingProxyType({
+    '.md': '📝',
+    '.txt': '📄',
+    '.ksp': '🚀',
+    '.py': '🐍',
+    '.sh': '📜',
+    '.yaml': '⚙️',
+    '.yml': '⚙️',
+    '.json': '📊',
+    '.ino': '🔧',
+    '.c': '💾',
+    '.cpp': '💾',
+    '.h': '📋',
+})
+
+# Tool and cache directories never shown in the tree; anything starting
+# with '.' (.git, .venv, ...) is skipped as hidden already
+_IGNORED_NAMES = frozenset({'__pycache__', 'node_modules'})
+
+# FILE_ICONS keyed on the bare extension, as rpartition('.') yields it
+_SUFFIX_ICONS = {suffix[1:]: icon for suffix, icon in FILE_ICONS.items()}
+
+FOLDER_ICONS = MappingProxyType({
+    'gaming': '🎮',
+    'cybersec': '🔒',
+    'embedded': '🔧',
+    'general': '📁',
+    'ksp': '🚀',
+    'factorio': '⚙️',
+    'missions': '🎯',
+    'designs': '📐',
+    'research': '🔬',
+    'exploits': '💀',
+    'reports': '📊',
+    'arduino': '🔌',
+    'circuits': '⚡',
+})
+
+
+# Node data is a (tag, payload) pair, told apart by identity:
+# (_FILE, Path), (_DIRECTORY, path str) or (_TEMPLATE, template id).
+# Directory contents are scanned the first time the node is expanded
+_FILE = object()
+_DIRECTORY = object()
+_TEMPLATE = object()
+_PLACEHOLDER_LABEL = "⏳ loading…"
+
+# Template node data is built up front so building the tree only adds leaves
+_TEMPLATES = MappingProxyType({
+    "gaming": (
+        ((_TEMPLATE, "ksp_mission"), "🚀 KSP Mission Plan"),
+        ((_TEMPLATE, "vessel_design"), "🛸 Vessel Design"),
+        ((_TEMPLATE, "orbital_transfer"), "🌍 Orbital Transfer"),
+        ((_TEMPLATE, "factorio_blueprint"), "⚙️ Factorio Blueprint"),
+    ),
+    "cybersec": (
+        ((_TEMPLATE, "pentest_report"), "📊 Pentest Report"),
+        ((_TEMPLATE, "vulnerability"), "🐛 Vulnerability Note"),
+        ((_TEMPLATE, "network_scan"), "🌐 Network Scan"),
+        ((_TEMPLATE, "exploit_poc"), "💀 Exploit PoC"),
+    ),
+    "embedded": (
+        ((_TEMPLATE, "arduino_project"), "🔌 Arduino Project"),
+        ((_TEMPLATE, "circuit_design"), "⚡ Circuit Design"),
+        ((_TEMPLATE, "sensor_log"), "📊 Sensor Data Log"),
+        ((_TEMPLATE, "device_spec"), "📋 Device Spec"),
+    ),
+})
+
+
+# One observer thread serves every panel; panels only add and drop watches
+_observer: Optional[Observer] = None
+_observer_lock = threading.Lock()
+
+
+def _shared_observer() -> Observer:
+    global _observer
+    
+    with _observer_lock:
+        if _observer is None:
+            _observer = Observer()
+            _observer.start()
+            atexit.register(_stop_shared_observer)
+        return _observer
+
+
+def _stop_shared_observer():
+    _observer.stop()
+    _observer.join(timeout=0.5)
+
+
+# Panels watching the same directory get the same ObservedWatch back from
+# schedule(); count them so it is only unscheduled once the last one leaves
+_watch_refs: Dict[ObservedWatch, int] = {}
+
+
+def _schedule_watch(handler: FileSystemEventHandler, path: str) -> ObservedWatch:
+    observer = _shared_observer()
+    
+    with _observer_lock:
+        watch = observer.schedule(handler, path, recursive=True)
+        _watch_refs[watch] = _watch_refs.get(watch, 0) + 1
+    return watch
+
+
+def _unschedule_watch(handler: FileSystemEventHandler, watch: ObservedWatch) -> None:
+    observer = _shared_observer()
+    
+    with _observer_lock:
+        refs = _watch_refs.pop(watch, 1) - 1
+        try:
+            if refs:
+                _watch_refs[watch] = refs
+                observer.remove_handler_for_watch(handler, watch)
+            else:
+                observer.unschedule(watch)
+        except KeyError:
+            pass  # Already gone along with its emitter
+
+
 class FileTreeHandler(FileSystemEventHandler):    
+    # Only these change what the tree shows; edits and open/close events don't
+    STRUCTURAL_EVENTS = frozenset({'created', 'deleted', 'moved'})
+    
+    # Seconds to collect a burst of events before refreshing once
+    DEBOUNCE_DELAY = 0.2
+    
     def __init__(self, tree_widget):
         self.tree_widget = tree_widget
         
+        # Resolved on the first flush; the widget isn't attached to an app yet
+        self._app = None
+        
+        # Touched by the observer thread and the timer thread
+        self._lock = threading.Lock()
+        self._dirty_paths: Set[str] = set()
+        self._timer: Optional[threading.Timer] = None
+        
     def on_any_event(self, event: FileSystemEvent):
-        if not event.is_directory or event.event_type in ['created', 'deleted', 'moved']:
-            # Schedule a refresh of the tree
-            pass
+        if event.event_type not in self.STRUCTURAL_EVENTS:
+            return
+        
+        with self._lock:
+            self._dirty_paths.add(os.path.dirname(event.src_path))
+            dest_path = getattr(event, 'dest_path', '')
+            if dest_path:
+                self._dirty_paths.add(os.path.dirname(dest_path))
+            
+            # The first event of a burst arms the timer; the rest ride along
+            if self._timer is None:
+                self._arm_timer()
+    
+    def _arm_timer(self):
+        self._timer = threading.Timer(self.DEBOUNCE_DELAY, self._flush)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _flush(self):
+        with self._lock:
+            dirty_paths, self._dirty_paths = self._dirty_paths, set()
+        
+        # The refresh runs on the UI thread while this one waits, so events
+        # arriving mid-rebuild are held for a single follow-up flush
+        try:
+            if self._app is None:
+                self._app = self.tree_widget.app
+            self._app.call_from_thread(self.tree_widget.refresh_directories, dirty_paths)
+        except RuntimeError:
+            pass  # Unmounted, or the app has already shut down
+        finally:
+            with self._lock:
+                self._timer = None
+                if self._dirty_paths:
+                    self._arm_timer()
+    
+    def cancel(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._dirty_paths.clear()
 
 
 class FileTreePanel(Tree):    
+    # Most directory listings kept by _scan_directory
+    DIR_CACHE_SIZE = 512
+    
     class FileSelected(Message):
         def __init__(self, file_path: Path):
             self.file_path = file_path
@@ -40,121 +219,191 @@ class FileTreePanel(Tree):
         self.base_path = Path(base_path).expanduser()
         self.current_profile = profile
         self.profile_path = self.base_path / profile
+        self._profile_path_str = str(self.profile_path)
+        
+        # Profile directories already created (or found) this session
+        self._known_profile_dirs: Set[Path] = set()
         
-        self.observer = Observer()
         self.file_handler = FileTreeHandler(self)
+        self._watch: Optional[ObservedWatch] = None
         
-        self.file_icons = {
-            '.md': '📝',
-            '.txt': '📄',
-            '.ksp': '🚀',
-            '.py': '🐍',
-            '.sh': '📜',
-            '.yaml': '⚙️',
-            '.yml': '⚙️',
-            '.json': '📊',
-            '.ino': '🔧',
-            '.c': '💾',
-            '.cpp': '💾',
-            '.h': '📋',
-        }
-        
-        self.folder_icons = {
-            'gaming': '🎮',
-            'cybersec': '🔒',
-            'embedded': '🔧',
-            'general': '📁',
-            'ksp': '🚀',
-            'factorio': '⚙️',
-            'missions': '🎯',
-            'designs': '📐',
-            'research': '🔬',
-            'exploits': '💀',
-            'reports': '📊',
-            'arduino': '🔌',
-            'circuits': '⚡',
-        }
-        
-        self.recent_files: List[Path] = []
+        # Keys only, least recently opened first
+        self.recent_files: "OrderedDict[Path, None]" = OrderedDict()
         self.max_recent = 5
         
+        # path -> (st_mtime_ns, sorted visible entries), least recently used first
+        self._dir_cache: "OrderedDict[str, Tuple[int, List[Tuple[str, str, bool]]]]" = OrderedDict()
+        
+        # Directories whose contents are in the tree, so a watcher refresh
+        # can patch just those nodes
+        self._path_to_node: Dict[str, TreeNode] = {}
+        
     def on_mount(self):
-        self.profile_path.mkdir(parents=True, exist_ok=True)
+        self._ensure_profile_dir()
         self.build_tree()
         self.start_watching()
         self.root.expand()
         
     def build_tree(self):
         self.clear()
+        self._path_to_node.clear()
         
         if self.recent_files:
             recent_node = self.root.add("⏰ Recent Files", expand=False)
-            for file_path in self.recent_files[:self.max_recent]:
+            for file_path in reversed(self.recent_files):
                 icon = self.get_file_icon(file_path)
-                recent_node.add_leaf(f"{icon} {file_path.name}").data = file_path
+                recent_node.add_leaf(icon + " " + file_path.name, data=(_FILE, file_path))
         
-        profile_icon = self.folder_icons.get(self.current_profile, '📁')
-        profile_node = self.root.add(f"{profile_icon} {self.current_profile}", expand=True)
+        profile_icon = FOLDER_ICONS.get(self.current_profile, '📁')
+        profile_node = self.root.add(profile_icon + " " + self.current_profile, expand=True)
         
-        self._add_directory_contents(profile_node, self.profile_path)
+        try:
+            self._add_directory_contents(profile_node, self._profile_path_str)
+        except FileNotFoundError:
+            # Removed since we last made it; recreate it and show it empty
+            self._known_profile_dirs.discard(self.profile_path)
+            self._ensure_profile_dir()
+            self._add_directory_contents(profile_node, self._profile_path_str)
         
         templates_node = self.root.add("📋 Templates", expand=False)
         self._add_templates(templates_node)
         
-    def _add_directory_contents(self, node, path: Path):
+    def _add_directory_contents(self, node, path: str):
+        self._path_to_node[path] = node
+        
         try:
-            items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-            
-            for item in items:
-                if item.name.startswith('.'):  # Skip hidden files
-                    continue
-                    
-                if item.is_dir():
-                    icon = self.folder_icons.get(item.name.lower(), '📁')
-                    dir_node = node.add(f"{icon} {item.name}", expand=False)
-                    self._add_directory_contents(dir_node, item)
-                else:
-                    icon = self.get_file_icon(item)
-                    leaf = node.add_leaf(f"{icon} {item.name}")
-                    leaf.data = item
-                    
+            entries = self._scan_directory(path)
         except PermissionError:
             node.add_leaf("⚠️ Permission Denied")
+            return
+        except OSError:
+            # Removed since it was listed, before the watcher caught up (or
+            # with no watcher running), so drop the stale node
+            self._forget_directory(path)
+            self.invalidate_directory(path)
+            if node.data is None:
+                raise  # The profile root; build_tree recreates it
+            node.remove()
+            return
+        
+        for name, entry_path, is_dir in entries:
+            self._add_entry(node, name, entry_path, is_dir)
+    
+    def _add_entry(self, node, name: str, entry_path: str, is_dir: bool, before: Optional[int] = None):
+        if is_dir:
+            icon = FOLDER_ICONS.get(name.lower(), '📁')
+            # The placeholder keeps the node expandable until it is scanned
+            dir_node = node.add(icon + " " + name, data=(_DIRECTORY, entry_path),
+                                before=before, expand=False)
+            dir_node.add_leaf(_PLACEHOLDER_LABEL)
+        else:
+            icon = self._icon_for_name(name)
+            node.add_leaf(icon + " " + name, data=(_FILE, Path(entry_path)), before=before)
+    
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        node = event.node
+        node_data = node.data
+        if node_data is None:
+            return
+        
+        tag, path = node_data
+        if tag is _DIRECTORY and path not in self._path_to_node:
+            node.remove_children()
+            self._add_directory_contents(node, path)
+    
+    def _update_directory(self, node, path: str):
+        """Bring one loaded directory node in line with the disk, touching only what changed"""
+        entries = self._scan_directory(path)
+        wanted = {(entry_path, is_dir) for _, entry_path, is_dir in entries}
+        
+        present = set()
+        for child in list(node.children):
+            child_data = child.data
+            if child_data is None:
+                child.remove()  # A stale placeholder or warning leaf
+                continue
+            
+            tag, payload = child_data
+            key = (payload, True) if tag is _DIRECTORY else (str(payload), False)
+            if key in wanted:
+                present.add(key)
+            else:
+                if tag is _DIRECTORY:
+                    self._forget_directory(payload)
+                child.remove()
+        
+        # Surviving children are still in sorted order, so each new entry
+        # goes in at its position in the fresh listing
+        for index, (name, entry_path, is_dir) in enumerate(entries):
+            if (entry_path, is_dir) not in present:
+                self._add_entry(node, name, entry_path, is_dir, before=index)
+    
+    def _forget_directory(self, path: str):
+        prefix = path + os.sep
+        for loaded in [p for p in self._path_to_node if p == path or p.startswith(prefix)]:
+            del self._path_to_node[loaded]
+    
+    def _scan_directory(self, path: str) -> List[Tuple[str, str, bool]]:
+        # A directory's mtime only moves when entries are added, removed or
+        # renamed, so an unchanged mtime means the sorted listing still holds
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            self._dir_cache.move_to_end(path)
+            return cached[1]
+        
+        # DirEntry keeps the file type from the directory read, so sorting
+        # and the dir/file split don't stat() each entry again. The sort key
+        # is built alongside each entry so sorting needs no Python callback
+        decorated = []
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if name[0] == '.' or name in _IGNORED_NAMES:
+                    continue
+                is_dir = entry.is_dir()
+                decorated.append(((not is_dir, name.lower()), (name, entry.path, is_dir)))
+        decorated.sort(key=itemgetter(0))
+        entries = [entry for _, entry in decorated]
+        
+        self._dir_cache[path] = (mtime, entries)
+        if len(self._dir_cache) > self.DIR_CACHE_SIZE:
+            self._dir_cache.popitem(last=False)
+        
+        return entries
+    
+    def invalidate_directory(self, path: str):
+        self._dir_cache.pop(path, None)
             
     def _add_templates(self, templates_node):
-        templates = {
-            "gaming": [
-                ("ksp_mission", "🚀 KSP Mission Plan"),
-                ("vessel_design", "🛸 Vessel Design"),
-                ("orbital_transfer", "🌍 Orbital Transfer"),
-                ("factorio_blueprint", "⚙️ Factorio Blueprint"),
-            ],
-            "cybersec": [
-                ("pentest_report", "📊 Pentest Report"),
-                ("vulnerability", "🐛 Vulnerability Note"),
-                ("network_scan", "🌐 Network Scan"),
-                ("exploit_poc", "💀 Exploit PoC"),
-            ],
-            "embedded": [
-                ("arduino_project", "🔌 Arduino Project"),
-                ("circuit_design", "⚡ Circuit Design"),
-                ("sensor_log", "📊 Sensor Data Log"),
-                ("device_spec", "📋 Device Spec"),
-            ],
-        }
-        
-        profile_templates = templates.get(self.current_profile, [])
-        for template_id, template_name in profile_templates:
-            leaf = templates_node.add_leaf(template_name)
-            leaf.data = f"template:{template_id}"
+        for template_data, template_name in _TEMPLATES.get(self.current_profile, ()):
+            templates_node.add_leaf(template_name, data=template_data)
     
     def get_file_icon(self, file_path: Path) -> str:
-        return self.file_icons.get(file_path.suffix.lower(), '📄')
+        return self._icon_for_name(file_path.name)
+    
+    def _icon_for_name(self, name: str) -> str:
+        _, dot, ext = name.rpartition('.')
+        if not dot:
+            return '📄'
+        # Most names already use a lowercase extension, so only fold case
+        # when the exact spelling misses
+        icon = _SUFFIX_ICONS.get(ext)
+        if icon is None:
+            icon = _SUFFIX_ICONS.get(ext.lower(), '📄')
+        return icon
+    
+    def _ensure_profile_dir(self):
+        # mkdir(exist_ok=True) still costs a syscall or two on every switch
+        if self.profile_path not in self._known_profile_dirs:
+            self.profile_path.mkdir(parents=True, exist_ok=True)
+            self._known_profile_dirs.add(self.profile_path)
     
     def set_profile(self, profile: str):
         self.current_profile = profile
         self.profile_path = self.base_path / profile
-        self.profile_path.mkdir(parents=True, exist_ok=True)
+        self._profile_path_str = str(self.profile_path)
+        self._ensure_profile_dir()
         
         self.stop_watching()
         self.build_tree()
@@ -162,42 +411,51 @@ class FileTreePanel(Tree):
     
     def start_watching(self):
         try:
-            self.observer.schedule(
-                self.file_handler,
-                str(self.profile_path),
-                recursive=True
-            )
-            if not self.observer.is_alive():
-                self.observer.start()
+            self._watch = _schedule_watch(self.file_handler, self._profile_path_str)
         except Exception as e:
             pass
     
     def stop_watching(self):
-        if self.observer.is_alive():
-            self.observer.stop()
-            self.observer.join(timeout=0.5)
+        self.file_handler.cancel()
+        if self._watch is not None:
+            _unschedule_watch(self.file_handler, self._watch)
+            self._watch = None
     
     def refresh_tree(self):
         self.build_tree()
     
+    def refresh_directories(self, directories: Set[str]):
+        for directory in directories:
+            self.invalidate_directory(directory)
+        
+        # Parents first, so a removed subtree is dropped before its own
+        # (now missing) directories come up
+        for directory in sorted(directories):
+            node = self._path_to_node.get(directory)
+            if node is None:
+                continue  # Not loaded yet; it is scanned fresh on expand
+            
+            try:
+                self._update_directory(node, directory)
+            except OSError:
+                self._forget_directory(directory)
+    
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
-        node = event.node
-        node_data = getattr(node, 'data', None)
-        
-        if node_data and isinstance(node_data, Path):
-            if node_data.is_file():
-                if node_data in self.recent_files:
-                    self.recent_files.remove(node_data)
-                self.recent_files.insert(0, node_data)
-                self.recent_files = self.recent_files[:self.max_recent]
+        node_data = event.node.data
+        if node_data is None:
+            return
+        
+        tag, payload = node_data
+        if tag is _FILE:
+            if payload.is_file():
+                self.recent_files.pop(payload, None)
+                self.recent_files[payload] = None
+                while len(self.recent_files) > self.max_recent:
+                    self.recent_files.popitem(last=False)
                 
-                self.post_message(self.FileSelected(node_data))
-        elif node_data and isinstance(node_data, str) and node_data.startswith("template:"):
-            template_id = node_data.split(":", 1)[1]
-            from textual.app import App
-            app = App.get_running_app()
-            if app:
-                app.notify(f"Template selected: {template_id}")
+                self.post_message(self.FileSelected(payload))
+        elif tag is _TEMPLATE:
+            self.app.notify(f"Template selected: {payload}")
     
     def on_unmount(self):
         self.stop_watching()
@@ -4,14 +4,64 @@ Theme Manager for HexShell
 Handles color schemes and visual theming
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any
 from textual.app import App
-from textual.css.query import NoMatches
+
+
+# Stylesheet location the active theme's rules are registered under
+_THEME_CSS_LOCATION = ("hexshell-theme", "")
+
+_THEME_CSS_TEMPLATE = """
+Header {{
+    background: {background_light};
+    color: {primary};
+}}
+
+Footer {{
+    background: {background_light};
+    color: {primary};
+}}
+
+.panel {{
+    border: heavy {border};
+    background: {background};
+}}
+
+.panel-header {{
+    background: {background_light};
+    color: {primary};
+    border-bottom: heavy {border};
+}}
+
+Tree {{
+    background: {background};
+    color: {text};
+}}
+
+TextArea {{
+    background: {background};
+    color: {text};
+}}
+
+Input {{
+    background: {background};
+    color: {text};
+    border: solid {border};
+}}
+
+#command-bar {{
+    background: {background_light};
+    border-top: heavy {border};
+}}
+"""
 
 
 class ThemeManager:
     
-    THEMES = {
+    _RAW_THEMES = {
         "cyberpunk_green": {
             "name": "Cyberpunk Green",
             "primary": "#00ff00",
@@ -89,6 +139,13 @@ class ThemeManager:
         }
     }
     
+    # Read-only view of _RAW_THEMES shared by every manager; the colour
+    # strings are interned so themes repeating a colour share one object
+    THEMES = MappingProxyType({
+        name: MappingProxyType({key: sys.intern(value) for key, value in theme.items()})
+        for name, theme in _RAW_THEMES.items()
+    })
+    
     def __init__(self):
         self.current_theme = "cyberpunk_green"
         
@@ -102,86 +159,15 @@ class ThemeManager:
         if theme_name not in self.THEMES:
             return False
         
-        theme = self.THEMES[theme_name]
         self.current_theme = theme_name
         
-        css_vars = f"""
-        :root {{
-            --primary: {theme['primary']};
-            --primary-dark: {theme['primary_dark']};
-            --secondary: {theme['secondary']};
-            --background: {theme['background']};
-            --background-light: {theme['background_light']};
-            --text: {theme['text']};
-            --text-dim: {theme['text_dim']};
-            --border: {theme['border']};
-            --error: {theme['error']};
-            --warning: {theme['warning']};
-            --info: {theme['info']};
-            --success: {theme['success']};
-        }}
-        """
-        
-        self._apply_dynamic_styles(app, theme)
+        # One source, re-added under the same location so the next theme
+        # replaces it; Textual then restyles every widget in a single pass
+        app.stylesheet.add_source(_render_theme_css(theme_name), read_from=_THEME_CSS_LOCATION)
+        app.refresh_css()
         
         return True
     
-    def _apply_dynamic_styles(self, app: App, theme: Dict[str, str]):
-        style_updates = {
-            "Header": {
-                "background": theme['background_light'],
-                "color": theme['primary']
-            },
-            "Footer": {
-                "background": theme['background_light'],
-                "color": theme['primary']
-            },
-            ".panel": {
-                "border": f"heavy {theme['border']}",
-                "background": theme['background']
-            },
-            ".panel-header": {
-                "background": theme['background_light'],
-                "color": theme['primary'],
-                "border-bottom": f"heavy {theme['border']}"
-            },
-            "Tree": {
-                "background": theme['background'],
-                "color": theme['text']
-            },
-            "TextArea": {
-                "background": theme['background'],
-                "color": theme['text']
-            },
-            "Input": {
-                "background": theme['background'],
-                "color": theme['text'],
-                "border": f"solid {theme['border']}"
-            },
-            "#command-bar": {
-                "background": theme['background_light'],
-                "border-top": f"heavy {theme['border']}"
-            }
-        }
-        
-        for selector, styles in style_updates.items():
-            try:
-                widgets = app.query(selector)
-                for widget in widgets:
-                    for style_name, style_value in styles.items():
-                        if style_name == "background":
-                            widget.styles.background = style_value
-                        elif style_name == "color":
-                            widget.styles.color = style_value
-                        elif style_name == "border":
-                            widget.styles.border = style_value
-                        elif style_name == "border-bottom":
-                            widget.styles.border_bottom = style_value
-                        elif style_name == "border-top":
-                            widget.styles.border_top = style_value
-            except NoMatches:
-                pass
-    
     def get_ascii_art_for_theme(self, theme_name: str) -> str:
         ascii_arts = {
             "cyberpunk_green": """
@@ -218,4 +204,10 @@ class ThemeManager:
     """
         }
         
-        return ascii_arts.get(theme_name, ascii_arts["cyberpunk_green"])
\ No newline at end of file
+        return ascii_arts.get(theme_name, ascii_arts["cyberpunk_green"])
+
+
+@lru_cache(maxsize=len(ThemeManager.THEMES))
+def _render_theme_css(theme_name: str) -> str:
+    # THEMES is read-only, so a theme's CSS never changes once rendered
+    return _THEME_CSS_TEMPLATE.format_map(ThemeManager.THEMES[theme_name])
@@ -4,87 +4,265 @@ Custom UI Widgets for HexShell
 Provides specialized input and display widgets
 """
 
-from typing import Optional, List, Callable
+import ast
+import sys
+import operator as op
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Callable, Deque, Tuple
 from textual.widgets import Input, Static, Button
 from textual.containers import Container, Horizontal, Vertical
 from textual.message import Message
+from textual.timer import Timer
 from textual import events
 from rich.text import Text
 from rich.panel import Panel
 
 
+# Arithmetic the calculator accepts; anything else in the expression is rejected
+_OPERATORS = {
+    ast.Add: op.add,
+    ast.Sub: op.sub,
+    ast.Mult: op.mul,
+    ast.Div: op.truediv,
+    ast.Pow: op.pow,
+    ast.USub: op.neg,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_expression(expr: str) -> ast.expr:
+    # Re-submitting a tweaked-then-restored expression skips the parse
+    return ast.parse(expr, mode='eval').body
+
+
+# Evaluation walks the tree post-order on an explicit stack of
+# (step, argument) pairs, so long a+b+c+... chains don't cost a Python frame
+# per operator or run into the recursion limit. Node steps push their
+# operands and a combining step; combining steps pop operand values.
+def _reject(node, stack, values):
+    raise TypeError(node)
+
+
+def _eval_constant(node: ast.Constant, stack, values):
+    # Only plain numbers; True, strings, None etc. are rejected like any
+    # other unsupported node
+    if type(node.value) not in (int, float, complex):
+        raise TypeError(node)
+    values.append(node.value)
+
+
+def _apply_binop(operator, stack, values):
+    right = values.pop()
+    values.append(operator(values.pop(), right))
+
+
+def _apply_unaryop(operator, stack, values):
+    values.append(operator(values.pop()))
+
+
+# The operator is looked up before the operands are queued, and the left
+# operand is pushed last so it is evaluated first
+def _eval_binop(node: ast.BinOp, stack, values):
+    left, right = node.left, node.right
+    stack.append((_apply_binop, _OPERATORS[type(node.op)]))
+    stack.append((_NODE_EVALUATORS.get(type(right), _reject), right))
+    stack.append((_NODE_EVALUATORS.get(type(left), _reject), left))
+
+
+def _eval_unaryop(node: ast.UnaryOp, stack, values):
+    operand = node.operand
+    stack.append((_apply_unaryop, _OPERATORS[type(node.op)]))
+    stack.append((_NODE_EVALUATORS.get(type(operand), _reject), operand))
+
+
+# One dict lookup on the node's exact type instead of an isinstance chain
+_NODE_EVALUATORS = {
+    ast.Constant: _eval_constant,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unaryop,
+}
+
+
+def _eval_node(root):
+    values = []
+    stack = [(_NODE_EVALUATORS.get(type(root), _reject), root)]
+    
+    while stack:
+        step, arg = stack.pop()
+        step(arg, stack, values)
+    
+    return values[0]
+
+
+_COMMANDS = MappingProxyType({
+    ":new": "Create new note",
+    ":profile": "Switch profile",
+    ":orbit": "Change orbital body",
+    ":deltav": "Calculate delta-v",
+    ":theme": "Change theme",
+    ":save": "Save current file",
+    ":quit": "Exit HexShell",
+    ":help": "Show help",
+    ":template": "Use template",
+    ":ascii": "Generate ASCII art",
+    ":calc": "Calculator",
+    ":stage": "Stage planner",
+    ":transfer": "Transfer window"
+})
+
+
+def _build_trie(commands) -> dict:
+    # Nested {char: {...}} dicts; the '' key marks a complete command
+    trie = {}
+    for command in commands:
+        command = sys.intern(command)
+        node = trie
+        for char in command:
+            node = node.setdefault(char, {})
+        node[''] = command
+    return trie
+
+
+_COMMAND_TRIE = _build_trie(_COMMANDS)
+
+
 class CommandInput(Input):    
-    class Submitted(Message):
-        def __init__(self, value: str):
-            self.value = value
-            super().__init__()
+    # Seconds to collect repeated navigation keys before redrawing
+    FLUSH_DELAY = 0.03
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.command_history: List[str] = []
-        self.history_index = -1
         self.max_history = 100
+        # Oldest commands fall off the left once it is full
+        self.command_history: Deque[str] = deque(maxlen=self.max_history)
+        self.history_index = -1
+        
+        # Key-driven edits waiting for the next flush
+        self._pending_value: Optional[str] = None
+        self._pending_notify: Optional[str] = None
+        self._flush_timer: Optional[Timer] = None
         
-        self.commands = {
-            ":new": "Create new note",
-            ":profile": "Switch profile",
-            ":orbit": "Change orbital body",
-            ":deltav": "Calculate delta-v",
-            ":theme": "Change theme",
-            ":save": "Save current file",
-            ":quit": "Exit HexShell",
-            ":help": "Show help",
-            ":template": "Use template",
-            ":ascii": "Generate ASCII art",
-            ":calc": "Calculator",
-            ":stage": "Stage planner",
-            ":transfer": "Transfer window"
-        }
+        # Completions last shown as a toast
+        self._last_suggest: Tuple[str, ...] = ()
+        
+        # Shared, read-only command table and its completion trie
+        self.commands = _COMMANDS
+        self._trie = _COMMAND_TRIE
+    
+    def _trie_find(self, prefix: str) -> List[str]:
+        node = self._trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        matches = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if '' in node:
+                matches.append(node[''])
+            # Reversed so branches come off the stack in insertion order
+            stack.extend(child for char, child in reversed(node.items()) if char)
+        return matches
     
     def on_key(self, event: events.Key) -> None:
         if event.key == "up":
             if self.command_history and self.history_index < len(self.command_history) - 1:
                 self.history_index += 1
-                self.value = self.command_history[-(self.history_index + 1)]
-                self.cursor_position = len(self.value)
+                self._defer_value(self.command_history[-(self.history_index + 1)])
         elif event.key == "down":
             if self.history_index > 0:
                 self.history_index -= 1
-                self.value = self.command_history[-(self.history_index + 1)]
-                self.cursor_position = len(self.value)
+                self._defer_value(self.command_history[-(self.history_index + 1)])
             elif self.history_index == 0:
                 self.history_index = -1
-                self.value = ""
+                self._defer_value("")
         elif event.key == "tab":
+            # Completing, so don't let Tab move focus off the command bar
+            event.prevent_default()
+            event.stop()
             self._autocomplete()
         else:
-            super().on_key(event)
+            # Typing takes over from a history value that hasn't landed yet
+            self._cancel_flush()
+    
+    def _defer_value(self, value: str):
+        # Held arrow keys repeat faster than is worth redrawing, so a burst
+        # only writes the value it ends on
+        self._pending_value = value
+        self._arm_flush()
+    
+    def _arm_flush(self):
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(self.FLUSH_DELAY, self._flush)
+    
+    def _cancel_flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._pending_value = None
+        self._pending_notify = None
+    
+    def _flush(self):
+        self._flush_timer = None
+        
+        if self._pending_value is not None:
+            self.value = self._pending_value
+            self.action_end()
+            self._pending_value = None
+        
+        if self._pending_notify is not None:
+            self.app.notify(self._pending_notify, severity="information")
+            self._pending_notify = None
     
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        command = self.value.strip()
+        # A deferred history value mustn't land on the cleared prompt, and
+        # the next Up starts from the newest command again
+        self._cancel_flush()
+        self.history_index = -1
+        
+        # Interned so repeats of a command share one string and compare by identity
+        command = sys.intern(self.value.strip())
         
         if command:
             if not self.command_history or self.command_history[-1] != command:
                 self.command_history.append(command)
-                if len(self.command_history) > self.max_history:
-                    self.command_history.pop(0)
             
-            self.history_index = -1
-            
-            self.post_message(self.Submitted(command))
+            self._last_suggest = ()
     
     def _autocomplete(self):
-        current = self.value.strip()
+        current = self.value if self._pending_value is None else self._pending_value
+        current = current.strip()
         
         if current.startswith(':'):
-            matches = [cmd for cmd in self.commands.keys() if cmd.startswith(current)]
+            matches = self._trie_find(current)
             
             if len(matches) == 1:
-                self.value = matches[0] + " "
-                self.cursor_position = len(self.value)
+                self._defer_value(matches[0] + " ")
             elif len(matches) > 1:
+                # Holding Tab on the same prefix shouldn't stack up toasts
+                suggestion_key = tuple(matches)
+                if suggestion_key == self._last_suggest:
+                    return
+                self._last_suggest = suggestion_key
+                
                 suggestions = ", ".join(matches)
-                self.app.notify(f"Suggestions: {suggestions}", severity="information")
+                self._pending_notify = f"Suggestions: {suggestions}"
+                self._arm_flush()
+
+
+# Button classes for the usual profile colours, shared by every selector
+_PROFILE_CLASSES = {
+    color: f"profile-button profile-{color}"
+    for color in ("green", "red", "blue", "yellow", "cyan", "magenta", "white")
+}
+
+
+def _profile_classes(color: str) -> str:
+    return _PROFILE_CLASSES.get(color) or f"profile-button profile-{color}"
 
 
 class ProfileSelector(Container):
@@ -98,22 +276,24 @@ class ProfileSelector(Container):
         super().__init__(**kwargs)
         self.profiles = profiles
         
+        # (label, profile id, widget id, classes) per button, worked out once
+        # rather than on every compose
+        self._button_specs = [
+            (
+                f"{i}. {profile.get('icon', '📁')} {profile.get('name', profile['id'])}",
+                profile['id'],
+                f"profile-{profile['id']}",
+                _profile_classes(profile.get('color', 'green')),
+            )
+            for i, profile in enumerate(self.profiles, 1)
+        ]
+        
     def compose(self):
         with Vertical(id="profile-selector"):
             yield Static("Select Profile", id="profile-title")
             
-            for i, profile in enumerate(self.profiles, 1):
-                icon = profile.get('icon', '📁')
-                name = profile.get('name', profile['id'])
-                color = profile.get('color', 'green')
-                
-                button_text = f"{i}. {icon} {name}"
-                yield ProfileButton(
-                    button_text,
-                    profile['id'],
-                    id=f"profile-{profile['id']}",
-                    classes=f"profile-button profile-{color}"
-                )
+            for button_text, profile_id, button_id, classes in self._button_specs:
+                yield ProfileButton(button_text, profile_id, id=button_id, classes=classes)
 
 
 class ProfileButton(Button):
@@ -135,38 +315,72 @@ class StatusBar(Static):
         self.modified = False
         self.mode = "INSERT"
         
+        # Each segment of the bar is re-formatted only when its own field
+        # changes; a render just joins them
+        self._mode_part = self._format_mode(self.mode)
+        self._profile_part = f"Profile: {self.profile}"
+        self._file_part = self._format_file()
+        
+        # What the bar currently shows, so re-asserting the same state
+        # doesn't trigger a refresh
+        self._last_status = ""
+        # Set while a render is queued for after the next refresh
+        self._dirty = False
+        
     def update_status(self, profile: Optional[str] = None, 
                      file_path: Optional[str] = None,
                      modified: Optional[bool] = None,
                      mode: Optional[str] = None):
         if profile is not None:
             self.profile = profile
+            self._profile_part = f"Profile: {profile}"
         if file_path is not None:
-            self.file_path = file_path
+            # Only the name is ever shown, so keep just that
+            self.file_path = file_path if isinstance(file_path, str) else file_path.name
         if modified is not None:
             self.modified = modified
+        if file_path is not None or modified is not None:
+            self._file_part = self._format_file()
         if mode is not None:
             self.mode = mode
-            
-        self._render_status()
-    
-    def _render_status(self):
-        parts = []
-        
-        if self.mode:
-            parts.append(f"[{self.mode}]")
-        
-        parts.append(f"Profile: {self.profile}")
+            self._mode_part = self._format_mode(mode)
         
+        # Several fields changed in one go (e.g. opening a file) render once
+        if not self._dirty:
+            self._dirty = True
+            self.call_after_refresh(self._flush_status)
+    
+    @staticmethod
+    def _format_mode(mode: str) -> str:
+        # Escaped so "[INSERT]" isn't read as a markup tag and dropped
+        return f"\\[{mode}]" if mode else ""
+    
+    def _format_file(self) -> str:
         if self.file_path:
-            file_name = self.file_path if isinstance(self.file_path, str) else self.file_path.name
             modified_indicator = " *" if self.modified else ""
-            parts.append(f"File: {file_name}{modified_indicator}")
-        else:
-            parts.append("No file")
+            return f"File: {self.file_path}{modified_indicator}"
+        return "No file"
+    
+    def _flush_status(self):
+        self._dirty = False
+        self._render_status()
+    
+    def _render_status(self):
+        status_text = " | ".join(
+            part for part in (self._mode_part, self._profile_part, self._file_part) if part
+        )
+        if status_text == self._last_status:
+            return
         
-        status_text = " | ".join(parts)
         self.update(status_text)
+        self._last_status = status_text
+
+
+@lru_cache(maxsize=32)
+def _art_panel(art: str, title: str) -> Panel:
+    # Never modified after construction, so showing the same art again can
+    # reuse the renderable
+    return Panel(art, title=title, border_style="green")
 
 
 class ASCIIArtDisplay(Static):    
@@ -175,7 +389,7 @@ class ASCIIArtDisplay(Static):
         
     def set_art(self, art: str, title: Optional[str] = None):
         if title:
-            content = Panel(art, title=title, border_style="green")
+            content = _art_panel(art, title)
         else:
             content = art
             
@@ -188,6 +402,7 @@ class CalculatorWidget(Container):
         super().__init__(**kwargs)
         self.expression = ""
         self.result = ""
+        self._result_widget: Optional[Static] = None
         
     def compose(self):
         with Vertical():
@@ -195,37 +410,22 @@ class CalculatorWidget(Container):
             yield Input(placeholder="Enter expression...", id="calc-input")
             yield Static("", id="calc-result")
     
+    def on_mount(self):
+        self._result_widget = self.query_one("#calc-result", Static)
+        
+        # Styled prefixes built once; results are appended to a copy as plain
+        # text, so Rich never has to parse markup on submit
+        self._ok_text = Text("= ", style="green")
+        self._err_text = Text("Error: ", style="red bold")
+    
     def on_input_submitted(self, event: Input.Submitted):
         try:
-            import ast
-            import operator as op
-            
-            operators = {
-                ast.Add: op.add,
-                ast.Sub: op.sub,
-                ast.Mult: op.mul,
-                ast.Div: op.truediv,
-                ast.Pow: op.pow,
-                ast.USub: op.neg,
-            }
-            
-            def eval_expr(expr):
-                def _eval(node):
-                    if isinstance(node, ast.Num):
-                        return node.n
-                    elif isinstance(node, ast.BinOp):
-                        return operators[type(node.op)](_eval(node.left), _eval(node.right))
-                    elif isinstance(node, ast.UnaryOp):
-                        return operators[type(node.op)](_eval(node.operand))
-                    else:
-                        raise TypeError(node)
-                
-                return _eval(ast.parse(expr, mode='eval').body)
-            
-            result = eval_expr(event.value)
-            result_widget = self.query_one("#calc-result", Static)
-            result_widget.update(f"= {result}")
+            result = _eval_node(_parse_expression(event.value))
+            text = self._ok_text.copy()
+            text.append(str(result))
             
         except Exception as e:
-            result_widget = self.query_one("#calc-result", Static)
-            result_widget.update(f"Error: {str(e)}")
\ No newline at end of file
+            text = self._err_text.copy()
+            text.append(str(e))
+        
+        self._result_widget.update(text)